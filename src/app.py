@@ -1,11 +1,23 @@
 import streamlit as st
-from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import re
+import string
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import praw  # 新增: Reddit API 库
 
+try:
+    from orjson import loads as json_loads  # 可选加速: 解析大体积 JSON 更快
+except ImportError:
+    from json import loads as json_loads
+
 # --- 页面配置 ---
 st.set_page_config(
     page_title="Sentiment Compass: 舆论信念罗盘",
@@ -14,93 +26,266 @@ st.set_page_config(
 )
 
 # --- 核心逻辑函数 (NLP) ---
+@st.cache_resource
+def get_vader_analyzer():
+    """进程级单例：词典文件只在进程内加载一次，不随每次 rerun 重新读取。"""
+    return SentimentIntensityAnalyzer()
+
+@st.cache_resource
+def get_text_scorer():
+    """
+    进程级记忆化打分函数。
+    Streamlit 每次 rerun 都会重新执行脚本，模块级的 lru_cache 会随之清空；
+    挂在 cache_resource 上才能跨 rerun、跨会话复用已算过的文本。
+    """
+    analyzer = get_vader_analyzer()
+    polarity_scores, lexicon = analyzer.polarity_scores, analyzer.lexicon  # 闭包内只做一次名查找
+
+    @lru_cache(maxsize=8192)
+    def score(text):
+        # 预检：不含任何词典词 (emoji 为非 ASCII，会被 VADER 转写成词，因此另行放行) 的文本，
+        # VADER 必然给出 compound = 0、neu = 1，直接返回，跳过完整的分词与规则计算
+        if text.isascii() and not _has_lexicon_word(text, lexicon):
+            return 0.0, 0.0
+        vs = polarity_scores(text)
+        return vs['compound'], 1.0 - vs['neu']
+
+    return score
+
+def _has_lexicon_word(text, lexicon):
+    """按 VADER 的切词方式 (空白切分、去首尾标点、小写查表) 判断是否存在词典词。"""
+    return any(tok in lexicon or tok.strip(string.punctuation) in lexicon
+               for tok in text.lower().split())
+
+_score_text = get_text_scorer()
+# 延迟/质量折中：规则模型的情绪判断主要由开头一两句决定，超出部分只增加词典扫描成本
+MAX_TEXT_LEN = 300
+# 同一标点/表情连续出现 5 次以上时截成 4 次，防止表情刷屏类文本拖慢分词
+# (VADER 对 "!"/"?" 的加权最多计到 4 个，这两类的评分不受影响)
+_NONWORD_RUN = re.compile(r'([^\w\s])\1{4,}')
+
 def analyze_sentiment(text):
     """
-    使用 TextBlob 进行基础情绪分析。
+    使用 VADER 进行基础情绪分析（单模型，替代 TextBlob 的词性标注管线）。
+    主观度取 pos + neg 的占比，即 1 - neu。
     Return: polarity (-1 to 1), subjectivity (0 to 1)
     """
-    if not text:
-        return 0, 0
-    blob = TextBlob(text)
-    return blob.sentiment.polarity, blob.sentiment.subjectivity
+    # 截短重复符号串，再合并连续空白：VADER 按空白切词，结果不变，但转帖中排版差异的文本可以命中同一缓存
+    # (不做小写化：全大写是 VADER 的情绪强调信号)
+    text = " ".join(_NONWORD_RUN.sub(r'\1\1\1\1', text or "").split())
+    # 空串/极短文本 (如自动回复) 几乎不携带情绪信号，跳过模型直接返回中性
+    if len(text) < 3:
+        return 0.0, 0.0
+    # 先规整再查缓存：转帖/重复标题直接命中，且截断长度以约束缓存内存
+    return _score_text(text[:MAX_TEXT_LEN])
+
+_SCORE_DTYPE = np.dtype([('pol', np.float32), ('subj', np.float32)])
+
+def analyze_batch(texts):
+    """
+    批量情绪分析，各数据源共用。
+    一次性流式写入 float32 结构化数组，避免逐行 dict 与 DataFrame 类型推断。
+    Return: (polarities, subjectivities)
+    """
+    scores = np.fromiter((analyze_sentiment(t) for t in texts), dtype=_SCORE_DTYPE, count=len(texts))
+    return scores['pol'], scores['subj']
+
+def annotate_sentiment(df):
+    """依据 Content 列补充 Sentiment / Subjectivity，并丢弃只用于分析的 Content。"""
+    # 兜底：缺失值在字符串列中可能变为 NaN，NaN 为真值会绕过空串判断，统一补成空串
+    pols, subjs = analyze_batch(df['Content'].fillna("").tolist())
+    return df.drop(columns='Content').assign(Sentiment=pols, Subjectivity=subjs)
+
+# 高主观度阈值：VADER 的 1 - neu 是带情绪词的占比，观点鲜明的帖子通常也只有 0.1~0.4，
+# 沿用 TextBlob 的 0.5 会让高噪点面板几乎总是空的
+HIGH_SUBJECTIVITY = 0.25
 
 def get_sentiment_label(score):
-    if score > 0.1:
+    # VADER compound 的惯用分界为 ±0.05
+    if score >= 0.05:
         return "积极 (Positive) 🟢"
-    elif score < -0.1:
+    elif score <= -0.05:
         return "消极 (Negative) 🔴"
     else:
         return "中性 (Neutral) ⚪"
 
+@st.cache_resource
+def get_http_session():
+    """进程级共享的 HTTP 会话：跨 rerun 复用连接池，省去重复的 TCP/TLS 握手。"""
+    session = requests.Session()
+    # 限流/网关错误做少量退避重试；raise_on_status=False 保留最后一次响应，便于展示 NewsAPI 的错误信息
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+_SEARCH_OPERATORS = {"AND", "OR", "NOT"}
+
+def _normalize_topic(topic):
+    """
+    话题规整后作为缓存键及查询串：关键词搜索不区分大小写，"Gold " 与 "gold" 应命中同一份结果。
+    布尔运算符只在大写时生效 (如 "bitcoin OR ethereum")，因此保持大写，其余词转小写。
+    """
+    return " ".join(tok if tok in _SEARCH_OPERATORS else tok.lower() for tok in topic.split())
+
+def _secret_digest(secret):
+    """密钥只以摘要形式参与缓存键，避免明文进入 Streamlit 的哈希流程。"""
+    return hashlib.sha256(secret.encode()).hexdigest()
+
 # --- 数据源 A: NewsAPI (机构/官方口径) ---
+class NewsAPIError(Exception):
+    """NewsAPI 返回 status != ok (如 Key 无效、触发限流)。"""
+
+# 同一话题 15 分钟内重复扫描 (同一进程内的所有会话共享) 直接复用原始响应，跳过网络请求
+# 只有成功结果会进入缓存：抛出的异常不会被 st.cache_data 记住，下次点击会重新请求
+# 以下划线开头的参数不参与 st.cache_data 的哈希
+@st.cache_data(ttl=900, show_spinner=False)
+def _fetch_news_json(topic, api_key_digest, _api_key):
+    # 通过 params 传参，由 requests 负责 URL 编码 (话题中的空格、& 等不再破坏查询串)
+    params = {"q": topic, "language": "en", "sortBy": "publishedAt", "pageSize": 50, "apiKey": _api_key}
+    # timeout=(连接, 读取)：慢端点不会无限期阻塞 Streamlit 脚本线程
+    response = get_http_session().get("https://newsapi.org/v2/everything", params=params, timeout=(3, 10))
+    data = json_loads(response.content)
+    if data.get("status") != "ok":
+        raise NewsAPIError(data.get("message"))
+    return data.get("articles", [])
+
 def fetch_news_data(topic, api_key):
+    """
+    Return: (DataFrame, 错误信息或 None)
+    DataFrame 只含原始列 Date / Text / Content / Source，情绪列由 annotate_sentiment 延后补充。
+    可在工作线程中调用：不直接调用 st.* 组件，错误信息交由脚本主线程展示。
+    """
     if not api_key:
-        return pd.DataFrame()
+        return pd.DataFrame(), None
     
-    url = f"https://newsapi.org/v2/everything?q={topic}&language=en&sortBy=publishedAt&pageSize=50&apiKey={api_key}"
     try:
-        response = requests.get(url)
-        data = response.json()
-        if data.get("status") != "ok":
-            st.error(f"NewsAPI Error: {data.get('message')}")
-            return pd.DataFrame()
-        
-        articles = data.get("articles", [])
-        processed_data = []
-        for article in articles:
-            title = article.get("title", "")
-            desc = article.get("description", "") or ""
-            date_str = article.get("publishedAt", "")[:10] # YYYY-MM-DD
-            full_text = f"{title}. {desc}"
-            
-            pol, subj = analyze_sentiment(full_text)
-            processed_data.append({
-                "Date": date_str,
-                "Text": title,
-                "Sentiment": pol,
-                "Subjectivity": subj,
-                "Source": "News (Institutional)"
-            })
-        return pd.DataFrame(processed_data)
+        articles = _fetch_news_json(_normalize_topic(topic), _secret_digest(api_key), api_key)
+    except NewsAPIError as e:
+        return pd.DataFrame(), f"NewsAPI Error: {e}"
     except Exception as e:
-        st.error(f"NewsAPI 请求失败: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), f"NewsAPI 请求失败: {e}"
+    
+    titles = [a.get("title", "") for a in articles]
+    # 入库即转为 datetime64：显式 ISO8601 格式走 pandas 快速解析路径，按 UTC 取日期，与 Reddit 口径一致
+    dates = pd.to_datetime(
+        [a.get("publishedAt", "") for a in articles], format="ISO8601", utc=True, errors="coerce"
+    ).tz_convert(None).floor('D')
+    
+    # Text 使用 Arrow 字符串列：比 object 列更省内存，st.dataframe 序列化时也无需再转换
+    # Content 为待分析文本。只分析标题：新闻情绪信号几乎都在标题里，拼接摘要会使分析量翻倍；标题重复率也更高，缓存更易命中
+    return pd.DataFrame({
+        "Date": dates,
+        "Text": pd.array(titles, dtype="string[pyarrow]"),
+        "Content": [t or "" for t in titles],  # title 可能为 null
+        "Source": "News (Institutional)"
+    }), None
 
 # --- 数据源 B: Reddit (大众/散户口径) ---
-def fetch_reddit_data(topic, client_id, client_secret, user_agent="sentiment_compass_v1"):
-    if not client_id or not client_secret:
-        return pd.DataFrame()
-    
-    try:
-        reddit = praw.Reddit(
+def get_reddit_client(client_id, client_secret, user_agent="sentiment_compass_v1"):
+    """
+    在用户会话内复用 praw 客户端，OAuth token 只在首次请求时协商一次。
+    读写 st.session_state，只能在脚本主线程调用。
+    """
+    key = f"_reddit_client_{client_id}"
+    digest = _secret_digest(client_secret)
+    cached = st.session_state.get(key)
+    # Secret 变更时重建客户端
+    if cached is None or cached[0] != digest:
+        cached = (digest, praw.Reddit(
             client_id=client_id,
             client_secret=client_secret,
             user_agent=user_agent
+        ))
+        st.session_state[key] = cached
+    return cached[1]
+
+# 缓存在进程内所有会话间共享：键中带上 Secret 摘要，凭据错误/已吊销的会话不会拿到别人的缓存结果，而是看到自己的鉴权错误
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_reddit_posts(topic, client_id, client_secret_digest, _reddit):
+    # 搜索 r/all，按 'new' 排序以捕捉最新信号
+    # limit=50 保证样本量与新闻对等
+    submissions = _reddit.subreddit("all").search(topic, sort="new", limit=50)
+    # 单次遍历，每个属性只读取一次；只保留用到的字段，缓存的是可序列化的纯数据
+    return [(sub.title, sub.selftext[:150], sub.created_utc) for sub in submissions]
+
+def fetch_reddit_data(topic, reddit):
+    """
+    reddit: get_reddit_client 返回的客户端，未配置时为 None。
+    Return: (DataFrame, 错误信息或 None)，约定同 fetch_news_data。
+    """
+    if reddit is None:
+        return pd.DataFrame(), None
+    
+    try:
+        posts = _fetch_reddit_posts(
+            _normalize_topic(topic), reddit.config.client_id, _secret_digest(reddit.config.client_secret), reddit
         )
-        # 搜索 r/all，按 'new' 排序以捕捉最新信号
-        # limit=50 保证样本量与新闻对等
-        submissions = reddit.subreddit("all").search(topic, sort="new", limit=50)
-        
-        processed_data = []
-        for sub in submissions:
-            # 结合标题和正文，更真实反映用户想法
-            full_text = f"{sub.title} . {sub.selftext}"
-            pol, subj = analyze_sentiment(full_text)
-            
-            # Reddit 使用 UTC 时间戳
-            date_str = datetime.fromtimestamp(sub.created_utc).strftime('%Y-%m-%d')
-            
-            processed_data.append({
-                "Date": date_str,
-                "Text": sub.title,
-                "Sentiment": pol,
-                "Subjectivity": subj,
-                "Source": "Reddit (Public/Retail)"
-            })
-        return pd.DataFrame(processed_data)
     except Exception as e:
-        st.error(f"Reddit API 连接失败: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), f"Reddit API 连接失败: {e}"
+    
+    # 行转列：zip 一次转置出各字段，无需逐行 append
+    titles, selftexts, utcs = zip(*posts) if posts else ((), (), ())
+    # 短标题再补充正文开头，更真实反映用户想法；长标题本身已足够表达情绪
+    texts = [t if len(t) > 80 else f"{t}. {b}" for t, b in zip(titles, selftexts)]
+    # Reddit 使用 UTC 时间戳：原始浮点数一次性向量化转换为日期 (与 NewsAPI 的 publishedAt 口径一致)
+    dates = pd.to_datetime(list(utcs), unit='s').floor('D')
+    
+    return pd.DataFrame({
+        "Date": dates,
+        "Text": pd.array(titles, dtype="string[pyarrow]"),
+        "Content": texts,
+        "Source": "Reddit (Public/Retail)"
+    }), None
+
+# --- 多数据源并发抓取 ---
+def fetch_all_sources(jobs):
+    """
+    并发执行各数据源的抓取任务，总耗时取决于最慢的一个；新增数据源只需追加一项。
+    jobs: [(fetch_fn, args), ...]
+    Return: 与 jobs 顺序一致的 [(DataFrame, 错误信息或 None), ...]
+    """
+    with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as ex:
+        futures = [ex.submit(fn, *args) for fn, args in jobs]
+        return [f.result() for f in futures]
+
+# --- 趋势聚合 ---
+def daily_mean_by_source(df):
+    """
+    按 (日期, 来源) 求平均情绪，返回 日期 × 来源 的宽表 (某来源当日无数据处为 NaN)。
+    在整数键 日序号 × 来源数 + 来源编码 上用 np.bincount 一次扫描完成分组求和与计数，不走哈希分组。
+    要求 Source 为 category 列。
+    """
+    df = df[df['Date'].notna()]
+    sources = df['Source'].cat.categories
+    if df.empty:
+        return pd.DataFrame(columns=sources, dtype=np.float64)
+    
+    days = df['Date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+    day0 = days.min()
+    n_days, n_src = int(days.max() - day0) + 1, len(sources)
+    key = (days - day0) * n_src + df['Source'].cat.codes.to_numpy()
+    sums = np.bincount(key, weights=df['Sentiment'].to_numpy(), minlength=n_days * n_src)
+    counts = np.bincount(key, minlength=n_days * n_src)
+    with np.errstate(invalid='ignore'):
+        means = (sums / counts).reshape(n_days, n_src)
+    
+    days_axis = np.arange(day0, day0 + n_days).astype('datetime64[D]').astype('datetime64[ns]')
+    index = pd.DatetimeIndex(days_axis, name='Date')
+    # 去掉所有来源都没有数据的日期
+    return pd.DataFrame(means, index=index, columns=sources).dropna(how='all')
+
+# 趋势图的静态布局：模块级构造一次，每次扫描只补充标题
+# 0 轴参考线直接写入 shapes/annotations，替代每次调用 add_hline
+_TREND_LAYOUT = dict(
+    yaxis=dict(title='情绪极性 (-1 悲观, 1 乐观)', range=[-1, 1]),
+    xaxis=dict(title='日期'),
+    hovermode="x unified",
+    legend=dict(orientation="h", y=1.1),
+    shapes=[dict(type="line", xref="paper", x0=0, x1=1, y0=0, y1=0,
+                 line=dict(color="gray", dash="dash"))],
+    annotations=[dict(text="中性基准", xref="paper", x=1, y=0,
+                      xanchor="right", yanchor="bottom", showarrow=False)]
+)
 
 # --- 侧边栏 ---
 with st.sidebar:
@@ -161,71 +346,89 @@ with tab2:
 
     if start_btn:
         if not news_api_key and not (reddit_cid and reddit_secret):
+            # 清掉上一次的结果，避免错误提示下方仍展示旧图表
+            st.session_state.pop("scan_result", None)
             st.error("请至少在侧边栏配置一个 API Key (NewsAPI 或 Reddit)！")
         else:
             with st.spinner(f"正在扫描 '{topic}' 的多维舆论信号..."):
-                # 1. 获取数据
-                df_news = fetch_news_data(topic, news_api_key)
-                df_reddit = fetch_reddit_data(topic, reddit_cid, reddit_secret)
+                # 1. 获取数据：各数据源并发请求
+                # (会话状态只能在主线程读写，客户端先在这里取出)
+                reddit = get_reddit_client(reddit_cid, reddit_secret) if reddit_cid and reddit_secret else None
+                (df_news, news_err), (df_reddit, reddit_err) = fetch_all_sources([
+                    (fetch_news_data, (topic, news_api_key)),
+                    (fetch_reddit_data, (topic, reddit)),
+                ])
+                # 错误提示回到脚本主线程输出
+                for err in (news_err, reddit_err):
+                    if err:
+                        st.error(err)
                 
                 # 2. 合并数据
                 df_all = pd.concat([df_news, df_reddit], ignore_index=True)
                 
                 if not df_all.empty:
-                    # 3. 数据聚合：按日期和来源计算平均情绪
-                    df_all['Date'] = pd.to_datetime(df_all['Date'])
-                    df_trend = df_all.groupby(['Date', 'Source'])['Sentiment'].mean().reset_index()
+                    # 抓取结果先行展示，情绪建模随后进行 (延迟计算，不占用抓取的关键路径)
+                    st.success(f"扫描完成！共抓取 {len(df_all)} 条数据 (News: {len(df_news)}, Reddit: {len(df_reddit)})")
                     
-                    st.success(f"扫描完成！共分析 {len(df_all)} 条数据 (News: {len(df_news)}, Reddit: {len(df_reddit)})")
-                    
-                    # 4. 绘制对比图
-                    fig_trend = go.Figure()
-                    
-                    # 只有新闻数据时
-                    if not df_news.empty:
-                        news_trend = df_trend[df_trend['Source'] == 'News (Institutional)']
-                        fig_trend.add_trace(go.Scatter(
-                            x=news_trend['Date'], y=news_trend['Sentiment'],
-                            mode='lines+markers', name='新闻 (机构/滞后)',
-                            line=dict(color='#1f77b4', width=3)
-                        ))
-                    
-                    # 只有 Reddit 数据时
-                    if not df_reddit.empty:
-                        reddit_trend = df_trend[df_trend['Source'] == 'Reddit (Public/Retail)']
-                        fig_trend.add_trace(go.Scatter(
-                            x=reddit_trend['Date'], y=reddit_trend['Sentiment'],
-                            mode='lines+markers', name='讨论 (散户/先行)',
-                            line=dict(color='#ff7f0e', width=3, dash='dot') # 虚线表示不稳定性
-                        ))
-
-                    fig_trend.update_layout(
-                        title=f"'{topic}' 舆论分歧图 (Sentiment Divergence)",
-                        yaxis=dict(title='情绪极性 (-1 悲观, 1 乐观)', range=[-1, 1]),
-                        xaxis=dict(title='日期'),
-                        hovermode="x unified",
-                        legend=dict(orientation="h", y=1.1)
-                    )
-                    
-                    # 添加参考线 (0轴)
-                    fig_trend.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="中性基准")
-                    
-                    st.plotly_chart(fig_trend, use_container_width=True)
-                    
-                    # 5. 详细数据展示 (增加主观度过滤)
-                    c1, c2 = st.columns(2)
-                    with c1:
-                        st.markdown("#### 📰 机构新闻 (Top News)")
-                        if not df_news.empty:
-                            st.dataframe(df_news[['Date', 'Text', 'Sentiment']].head(10), use_container_width=True)
-                    
-                    with c2:
-                        st.markdown("#### 🗣️ 散户高噪点 (High Subjectivity)")
-                        st.caption("筛选主观度 > 0.5 的言论，通常包含强烈暗示。")
-                        if not df_reddit.empty:
-                            # 筛选高主观度言论
-                            high_subj = df_reddit[df_reddit['Subjectivity'] > 0.5].sort_values('Sentiment')
-                            st.dataframe(high_subj[['Date', 'Text', 'Sentiment']].head(10), use_container_width=True)
-                            
+                    # 3. 情绪建模，再按日期和来源计算平均情绪
+                    df_all = annotate_sentiment(df_all)
+                    # Source 转为 category (合并后再转，两边类别才一致)：分组时按整数编码而非逐个字符串哈希
+                    df_all['Source'] = df_all['Source'].astype('category')
+                    # 结果存入会话状态：之后任何控件触发的 rerun 都直接复用，只有点击扫描才会请求 API
+                    st.session_state["scan_result"] = {
+                        "topic": topic,
+                        "data": df_all,
+                        # 日期 × 来源 的宽表，每个来源一列，直接作为各条曲线
+                        "trend": daily_mean_by_source(df_all),
+                    }
                 else:
-                    st.warning("未找到数据，请检查 API Key 或尝试更换关键词。")
\ No newline at end of file
+                    st.session_state.pop("scan_result", None)
+                    st.warning("未找到数据，请检查 API Key 或尝试更换关键词。")
+
+    # 渲染最近一次扫描的结果 (话题输入框改动后不再展示旧话题的结果)
+    scan = st.session_state.get("scan_result")
+    if scan and scan["topic"] == topic:
+        df_all, df_trend = scan["data"], scan["trend"]
+        df_news = df_all[df_all['Source'] == 'News (Institutional)']
+        df_reddit = df_all[df_all['Source'] == 'Reddit (Public/Retail)']
+        
+        # 4. 绘制对比图
+        fig_trend = go.Figure()
+        
+        # 宽表中某来源在某日无数据时为 NaN，connectgaps 让曲线跨过空缺保持连续
+        # 只有新闻数据时
+        if 'News (Institutional)' in df_trend:
+            fig_trend.add_trace(go.Scatter(
+                x=df_trend.index, y=df_trend['News (Institutional)'],
+                mode='lines+markers', name='新闻 (机构/滞后)', connectgaps=True,
+                line=dict(color='#1f77b4', width=3)
+            ))
+        
+        # 只有 Reddit 数据时
+        if 'Reddit (Public/Retail)' in df_trend:
+            fig_trend.add_trace(go.Scatter(
+                x=df_trend.index, y=df_trend['Reddit (Public/Retail)'],
+                mode='lines+markers', name='讨论 (散户/先行)', connectgaps=True,
+                line=dict(color='#ff7f0e', width=3, dash='dot') # 虚线表示不稳定性
+            ))
+
+        fig_trend.update_layout(title=f"'{topic}' 舆论分歧图 (Sentiment Divergence)", **_TREND_LAYOUT)
+        
+        st.plotly_chart(fig_trend, use_container_width=True)
+        
+        # 5. 详细数据展示 (增加主观度过滤)
+        c1, c2 = st.columns(2)
+        with c1:
+            st.markdown("#### 📰 机构新闻 (Top News)")
+            if not df_news.empty:
+                st.dataframe(df_news[['Date', 'Text', 'Sentiment']].head(10), use_container_width=True,
+                             column_config={'Date': st.column_config.DateColumn()})
+        
+        with c2:
+            st.markdown("#### 🗣️ 散户高噪点 (High Subjectivity)")
+            st.caption(f"筛选主观度 (情绪词占比) > {HIGH_SUBJECTIVITY} 的言论，通常包含强烈暗示。")
+            if not df_reddit.empty:
+                # 筛选高主观度言论，只取最悲观的 10 条 (部分选择，无需全量排序)
+                high_subj = df_reddit[df_reddit['Subjectivity'] > HIGH_SUBJECTIVITY].nsmallest(10, 'Sentiment')
+                st.dataframe(high_subj[['Date', 'Text', 'Sentiment']], use_container_width=True,
+                             column_config={'Date': st.column_config.DateColumn()})